@@ -208,7 +208,7 @@ class BetaBinomial(object):
         return stats.binom(self.n, p).rvs(size=size, random_state=random_state)
 
     def _check_input(self, k):
-        k = np.floor(k).astype(np.int)
+        k = np.floor(k).astype(int)
 
         if np.any(k < 0):
             raise ValueError("k must be >= 0.")
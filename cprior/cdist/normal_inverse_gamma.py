@@ -45,9 +45,8 @@ def func_ab_el(x, muA, sA, vA, muB, sB, vB):
 
 def func_mv_student_ppf(x, variant_params, p):
     """Function CDF of max of student t random variables for root-finding."""
-    cdf = 1.0
-    for (mu, la, a, b) in variant_params:
-        cdf *= special.stdtr(2 * a, (x - mu) / np.sqrt(b / a / la))
+    uu, ll, aa, bb = variant_params
+    cdf = np.prod(special.stdtr(2 * aa, (x - uu) / np.sqrt(bb / aa / ll)))
     return cdf - p
 
 
@@ -55,10 +54,9 @@ def func_mv_inverse_gamma_ppf(x, variant_params, p):
     """
     Function CDF of max of inverse gamma random variables for root-finding.
     """
-    cdf = 1.0
+    _, _, aa, bb = variant_params
     x = np.maximum(x, 1e-15)
-    for (_, _, a, b) in variant_params:
-        cdf *= special.gammaincc(a, b / x)
+    cdf = np.prod(special.gammaincc(aa, bb / x))
     return cdf - p
 
 
@@ -68,8 +66,8 @@ def func_mv_prob_mean(x, mu, s, v, variant_params):
     pdf = np.exp(-0.5 * (1 + v) * np.log(1 + t ** 2 / v)
                  - 0.5 * np.log(v) - np.log(s) - special.betaln(v * 0.5, 0.5))
 
-    cdf = np.prod([special.stdtr(2 * a, (x - mu) / np.sqrt(b / a / la))
-                   for (mu, la, a, b) in variant_params], axis=0)
+    uu, ll, aa, bb = variant_params
+    cdf = np.prod(special.stdtr(2 * aa, (x - uu) / np.sqrt(bb / aa / ll)))
     return pdf * cdf
 
 
@@ -77,16 +75,15 @@ def func_mv_prob_var(x, a, b, variant_params):
     """Integratnd probability integral."""
     pdf = np.exp(a * np.log(b) - (a + 1) * np.log(x) - b / x
                  - special.gammaln(a))
-    cdf = np.prod([special.gammaincc(a, b / x)
-                   for (_, _, a, b) in variant_params], axis=0)
+    _, _, aa, bb = variant_params
+    cdf = np.prod(special.gammaincc(aa, bb / x))
     return pdf * cdf
 
 
 def func_mv_el_mean(x, mu, s, v, variant_params):
     """Integrand expected loss integral."""
-    n = len(variant_params)
-
-    uu, ll, aa, bb = map(np.array, zip(*variant_params))
+    uu, ll, aa, bb = variant_params
+    n = len(uu)
 
     vv = 2 * aa
     ss = np.sqrt(bb / aa / ll)
@@ -108,9 +105,8 @@ def func_mv_el_mean(x, mu, s, v, variant_params):
 
 def func_mv_el_var(x, a, b, variant_params):
     """Integrand expected loss integral."""
-    n = len(variant_params)
-
-    _, _, aa, bb = map(np.array, zip(*variant_params))
+    _, _, aa, bb = variant_params
+    n = len(aa)
 
     pdf = np.exp(aa * np.log(bb) - (aa + 1) * np.log(x) - bb / x
                  - special.gammaln(aa))
@@ -126,9 +122,8 @@ def func_mv_el_var(x, a, b, variant_params):
 
 def func_mv_elr_mean(x, variant_params):
     """Integrand expected loss relative integral."""
-    n = len(variant_params)
-
-    uu, ll, aa, bb = map(np.array, zip(*variant_params))
+    uu, ll, aa, bb = variant_params
+    n = len(uu)
 
     vv = 2 * aa
     ss = np.sqrt(bb / aa / ll)
@@ -145,9 +140,8 @@ def func_mv_elr_mean(x, variant_params):
 
 def func_mv_elr_var(x, variant_params):
     """Integrand expected loss relative integral."""
-    n = len(variant_params)
-
-    _, _, aa, bb = map(np.array, zip(*variant_params))
+    _, _, aa, bb = variant_params
+    n = len(aa)
 
     pdf = np.exp(aa * np.log(bb) - (aa + 1) * np.log(x) - bb / x
                  - special.gammaln(aa))
@@ -158,6 +152,44 @@ def func_mv_elr_var(x, variant_params):
     return x * pdf
 
 
+def probability_batch(muA, laA, aA, bA, muB, laB, aB, bB):
+    """
+    Compute the error probability :math:`P[A > B]` for many pairs of
+    normal-inverse-gamma posteriors at once.
+
+    Parameters
+    ----------
+    muA, laA, aA, bA : array-like
+        Posterior parameters (location, variance scale, shape and scale) of
+        variant A.
+
+    muB, laB, aB, bB : array-like
+        Posterior parameters (location, variance scale, shape and scale) of
+        variant B.
+
+    Returns
+    -------
+    (prob_mean, prob_var) : tuple of numpy.ndarray
+        Probabilities for the mean and the variance.
+
+    Notes
+    -----
+    The error probability of the mean always uses the normal approximation
+    of the Student's t-distribution, which requires large shape parameters.
+    See :meth:`NormalInverseGammaABTest.probability`.
+    """
+    muA, laA, aA, bA = map(np.asarray, (muA, laA, aA, bA))
+    muB, laB, aB, bB = map(np.asarray, (muB, laB, aB, bB))
+
+    sigA = np.sqrt(bA / (aA - 1) / laA)
+    sigB = np.sqrt(bB / (aB - 1) / laB)
+
+    prob_mean = special.ndtr((muA - muB) / np.hypot(sigA, sigB))
+    prob_var = special.betainc(aA, aB, bA / (bA + bB))
+
+    return prob_mean, prob_var
+
+
 class NormalInverseGamma(object):
     """
     Normal-inverse-gamma distribution.
@@ -192,6 +224,12 @@ class NormalInverseGamma(object):
         if self.scale <= 0:
             raise ValueError("scale must be > 0; got {}.".format(self.scale))
 
+        # parameter-only terms of logpdf and logcdf
+        t = self.shape * np.log(self.scale) - special.gammaln(self.shape)
+        self._c_logcdf = t
+        self._c_logpdf = (t + 0.5 * np.log(self.variance_scale)
+                          - 0.9189385332046727)
+
     def mean(self):
         """
         Mean of the Normal-inverse-gamma probability.
@@ -276,13 +314,18 @@ class NormalInverseGamma(object):
         """
         x, sig2 = self._check_input(x, sig2)
 
-        logsig2 = np.log(sig2)
-        t0 = 0.5 * np.log(self.variance_scale) - 0.9189385332046727
-        t1 = self.shape * np.log(self.scale) - special.gammaln(self.shape)
-        t2 = -(self.shape + 1.5) * logsig2
-        t3 = self.scale + 0.5 * self.variance_scale * (x - self.loc) ** 2
+        logpdf = np.log(sig2, dtype=np.float64)
+        logpdf *= -(self.shape + 1.5)
+        logpdf += self._c_logpdf
 
-        return t0 + t1 + t2 - t3 / sig2
+        t = np.subtract(x, self.loc, dtype=np.float64)
+        t *= t
+        t *= 0.5 * self.variance_scale
+        t += self.scale
+        t /= sig2
+        logpdf -= t
+
+        return logpdf
 
     def pdf(self, x, sig2):
         """
@@ -301,7 +344,8 @@ class NormalInverseGamma(object):
         pdf : numpy.ndarray
             Probability density function evaluated at (x, sig2).
         """
-        return np.exp(self.logpdf(x, sig2))
+        logpdf = np.asarray(self.logpdf(x, sig2))
+        return np.exp(logpdf, out=logpdf)[()]
 
     def logcdf(self, x, sig2):
         """
@@ -322,12 +366,16 @@ class NormalInverseGamma(object):
         """
         x, sig2 = self._check_input(x, sig2)
 
-        xu = (self.variance_scale / sig2) ** 0.5 * (x - self.loc)
-        t0 = -self.scale / sig2 + self.shape * np.log(self.scale)
-        t1 = -(self.shape + 1) * np.log(sig2) - special.gammaln(self.shape)
-        t2 = special.log_ndtr(xu)
+        logcdf = np.log(sig2, dtype=np.float64)
+        logcdf *= -(self.shape + 1)
+        logcdf += self._c_logcdf
+        logcdf -= self.scale / sig2
+
+        xu = np.subtract(x, self.loc, dtype=np.float64)
+        xu *= np.sqrt(self.variance_scale / sig2)
+        logcdf += special.log_ndtr(xu)
 
-        return t0 + t1 + t2
+        return logcdf
 
     def cdf(self, x, sig2):
         """
@@ -346,9 +394,10 @@ class NormalInverseGamma(object):
         cdf : numpy.ndarray
             Cumulative distribution function evaluated at (x, sig2).
         """
-        return np.exp(self.logcdf(x, sig2))
+        logcdf = np.asarray(self.logcdf(x, sig2))
+        return np.exp(logcdf, out=logcdf)[()]
 
-    def rvs(self, size=1, random_state=None):
+    def rvs(self, size=1, random_state=None, antithetic=False):
         """
         Normal-inverse-gamma random variates.
 
@@ -357,22 +406,45 @@ class NormalInverseGamma(object):
         size : int (default=1)
             Number of random variates.
 
-        random_state : int or None (default=None)
-            The seed used by the random number generator.
+        random_state : int, numpy.random.Generator or None (default=None)
+            The seed used by the random number generator or the generator
+            itself.
+
+        antithetic : bool (default=False)
+            Whether to generate the standard normal variates in antithetic
+            pairs.
 
         Returns
         -------
         rvs : numpy.ndarray
             Random variates of given size (size, 2).
+
+        Notes
+        -----
+        If ``antithetic=True``, the standard normal variates are generated in
+        antithetic pairs :math:`(z, -z)`, which reduces the variance of Monte
+        Carlo estimates depending monotonically on the location. The variates
+        are then not independent, thus they are not suitable for estimators
+        assuming i.i.d. samples, e.g., standard errors or bootstrapping.
         """
-        sig2_rv = stats.invgamma(a=self.shape, scale=self.scale).rvs(
-            size=size, random_state=random_state)
+        rng = np.random.default_rng(random_state)
 
-        x_rv = stats.norm(loc=self.loc,
-                          scale=np.sqrt(sig2_rv / self.variance_scale)).rvs(
-                          size=size, random_state=random_state)
+        # inverse gamma variates as the reciprocal of gamma variates
+        sig2_rv = self.scale / rng.standard_gamma(self.shape, size=size)
 
-        return np.c_[x_rv, sig2_rv]
+        if antithetic:
+            z = rng.standard_normal((size + 1) // 2)
+            z = np.concatenate((z, -z))[:size]
+        else:
+            z = rng.standard_normal(size)
+
+        rvs = np.empty((size, 2), dtype=np.float64)
+        rvs[:, 1] = sig2_rv
+        np.sqrt(sig2_rv / self.variance_scale, out=rvs[:, 0])
+        rvs[:, 0] *= z
+        rvs[:, 0] += self.loc
+
+        return rvs
 
     def _check_input(self, x, sig2):
         x = np.asarray(x)
@@ -384,7 +456,7 @@ class NormalInverseGamma(object):
             raise ValueError("Input variables with inconsistent dimensions. "
                              "{} != {}".format(x_shape, sig2_shape))
 
-        if np.any(sig2 <= 0):
+        if sig2.size and sig2.min() <= 0:
             raise ValueError("sig2 must be > 0.")
 
         return x, sig2
@@ -425,6 +497,10 @@ class NormalInverseGammaModel(BayesModel):
         self._shape_posterior = shape
         self._scale_posterior = scale
 
+        # frozen posterior distribution, rebuilt when the posterior changes
+        self._dist = None
+        self._dist_params = None
+
         if self.variance_scale <= 0:
             raise ValueError("variance_scale must be > 0; got {}.".format(
                 self.variance_scale))
@@ -487,10 +563,7 @@ class NormalInverseGammaModel(BayesModel):
         -------
         mean : tuple of floats
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior, scale=self._scale_posterior).mean()
+        return self._posterior_dist().mean()
 
     def var(self):
         """
@@ -500,10 +573,7 @@ class NormalInverseGammaModel(BayesModel):
         -------
         var : tuple of floats
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior, scale=self._scale_posterior).var()
+        return self._posterior_dist().var()
 
     def std(self):
         """
@@ -513,10 +583,7 @@ class NormalInverseGammaModel(BayesModel):
         -------
         std : tuple of floats
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior, scale=self._scale_posterior).std()
+        return self._posterior_dist().std()
 
     def pdf(self, x, sig2):
         """
@@ -535,11 +602,7 @@ class NormalInverseGammaModel(BayesModel):
         pdf : numpy.ndarray
            Probability density function evaluated at (x, sig2).
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior, scale=self._scale_posterior
-            ).pdf(x, sig2)
+        return self._posterior_dist().pdf(x, sig2)
 
     def cdf(self, x, sig2):
         """
@@ -558,11 +621,7 @@ class NormalInverseGammaModel(BayesModel):
         cdf : numpy.ndarray
             Cumulative distribution function evaluated at (x, sig2).
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior,
-            scale=self._scale_posterior).cdf(x, sig2)
+        return self._posterior_dist().cdf(x, sig2)
 
     def ppf(self, q):
         """
@@ -588,7 +647,7 @@ class NormalInverseGammaModel(BayesModel):
 
         return x_ppf, sig2_ppf
 
-    def rvs(self, size=1, random_state=None):
+    def rvs(self, size=1, random_state=None, antithetic=False):
         """
         Random variates of the posterior distribution.
 
@@ -597,19 +656,39 @@ class NormalInverseGammaModel(BayesModel):
         size : int (default=1)
             Number of random variates.
 
-        random_state : int or None (default=None)
-            The seed used by the random number generator.
+        random_state : int, numpy.random.Generator or None (default=None)
+            The seed used by the random number generator or the generator
+            itself.
+
+        antithetic : bool (default=False)
+            Whether to generate the location variates in antithetic pairs.
 
         Returns
         -------
         rvs : numpy.ndarray
             Random variates of given size (size, 2).
+
+        Notes
+        -----
+        Antithetic variates are mirrored around the location, so consecutive
+        halves of the sample are not independent. They reduce the variance of
+        Monte Carlo estimates of the A/B and multivariate tests, which use
+        them internally, such that a smaller number of ``simulations``, about
+        half, attains a similar accuracy for the mean. Keep the default
+        ``antithetic=False`` whenever i.i.d. samples are required.
         """
-        return NormalInverseGamma(
-            loc=self._loc_posterior,
-            variance_scale=self._variance_scale_posterior,
-            shape=self._shape_posterior, scale=self._scale_posterior).rvs(
-            size=size, random_state=random_state)
+        return self._posterior_dist().rvs(size=size, random_state=random_state,
+                                          antithetic=antithetic)
+
+    def _posterior_dist(self):
+        params = (self._loc_posterior, self._variance_scale_posterior,
+                  self._shape_posterior, self._scale_posterior)
+
+        if params != self._dist_params:
+            self._dist = NormalInverseGamma(*params)
+            self._dist_params = params
+
+        return self._dist
 
 
 class NormalInverseGammaABTest(BayesABTest):
@@ -633,6 +712,9 @@ class NormalInverseGammaABTest(BayesABTest):
     def __init__(self, modelA, modelB, simulations=1000000, random_state=None):
         super().__init__(modelA, modelB, simulations, random_state)
 
+        # last Monte Carlo samples and the settings used to draw them
+        self._mc_cache = None
+
     def probability(self, method="exact", variant="A", lift=0):
         """
         Compute the error probability or *chance to beat control*.
@@ -665,6 +747,10 @@ class NormalInverseGammaABTest(BayesABTest):
         t-distribution for the error probability of the mean when the number
         of degrees of freedom is large. For small values, numerical
         intergration is used.
+
+        Method "MC" samples are cached and reused until ``simulations``,
+        ``random_state`` or the posterior parameters change. Hence, repeated
+        calls return identical estimates, even if ``random_state=None``.
         """
         check_ab_method(method=method, method_options=("exact", "MC"),
                         variant=variant, lift=lift)
@@ -680,77 +766,68 @@ class NormalInverseGammaABTest(BayesABTest):
             aB = self.modelB.shape_posterior
             bB = self.modelB.scale_posterior
 
-            sigA = self.modelA.std()[0]
-            sigB = self.modelB.std()[0]
-
-            if variant == "A":
-                # mean
-                if min(aA, aB) > 50:
-                    # mean using normal approximation
-                    sigA = self.modelA.std()[0]
-                    sigB = self.modelB.std()[0]
+            if min(aA, aB) > 50:
+                # mean using normal approximation
+                sigA = self.modelA.std()[0]
+                sigB = self.modelB.std()[0]
+                dz = (muA - muB) / np.hypot(sigA, sigB)
 
-                    prob_mean = special.ndtr((muA - muB) /
-                                             np.hypot(sigA, sigB))
-                else:
-                    # numerical integration
-                    sA = np.sqrt(bA / aA / laA)
-                    sB = np.sqrt(bB / aB / laB)
+                prob_mean_A = special.ndtr(dz)
+                prob_mean_B = special.ndtr(-dz)
+            else:
+                # numerical integration
+                sA = np.sqrt(bA / aA / laA)
+                sB = np.sqrt(bB / aB / laB)
 
-                    prob_mean = integrate.quad(
+                if variant in ("A", "all"):
+                    prob_mean_A = integrate.quad(
                         func=func_ab_prob, a=-np.inf, b=np.inf, args=(
                             muA, sA, 2*aA, muB, sB, 2*aB))[0]
 
-                # variance
-                p = bA / (bA + bB)
-                prob_var = special.betainc(aA, aB, p)
-                return prob_mean, prob_var
-
-            elif variant == "B":
-                if min(aA, aB) > 50:
-                    # mean using normal approximation
-                    sigA = self.modelA.std()[0]
-                    sigB = self.modelB.std()[0]
-
-                    prob_mean = special.ndtr((muB - muA) /
-                                             np.hypot(sigA, sigB))
-                else:
-                    # numerical integration
-                    sA = np.sqrt(bA / aA / laA)
-                    sB = np.sqrt(bB / aB / laB)
-
-                    prob_mean = integrate.quad(
+                if variant in ("B", "all"):
+                    prob_mean_B = integrate.quad(
                         func=func_ab_prob, a=-np.inf, b=np.inf, args=(
                             muB, sB, 2*aB, muA, sA, 2*aA))[0]
 
-                # variance
-                p = bB / (bA + bB)
-                prob_var = special.betainc(aB, aA, p)
-                return prob_mean, prob_var
-            else:
-                prob_mean_A, prob_var_A = self.probability(
-                    method=method, variant="A", lift=lift)
+            # variance: I_p(aA, aB) = 1 - I_{1-p}(aB, aA), evaluate the
+            # smaller tail to preserve accuracy and complement the other
+            p = bA / (bA + bB)
 
-                prob_mean_B, prob_var_B = self.probability(
-                    method=method, variant="B", lift=lift)
+            if p < aA / (aA + aB):
+                prob_var_A = special.betainc(aA, aB, p)
+                prob_var_B = 1.0 - prob_var_A
+            else:
+                prob_var_B = special.betainc(aB, aA, bB / (bA + bB))
+                prob_var_A = 1.0 - prob_var_B
 
+            if variant == "A":
+                return prob_mean_A, prob_var_A
+            elif variant == "B":
+                return prob_mean_B, prob_var_B
+            else:
                 return (prob_mean_A, prob_var_A), (prob_mean_B, prob_var_B)
         else:
-            data_A = self.modelA.rvs(self.simulations, self.random_state)
-            data_B = self.modelB.rvs(self.simulations, self.random_state)
+            data_A, data_B = self._rvs()
 
             xA, sig2A = data_A[:, 0], data_A[:, 1]
             xB, sig2B = data_B[:, 0], data_B[:, 1]
 
+            # differences are shared by both variants
+            dx = xA - xB
+            dsig2 = sig2A - sig2B
+            n = dx.size
+
             if variant == "A":
-                return (xA > xB + lift).mean(), (sig2A > sig2B + lift).mean()
+                return (np.count_nonzero(dx > lift) / n,
+                        np.count_nonzero(dsig2 > lift) / n)
             elif variant == "B":
-                return (xB > xA + lift).mean(), (sig2B > sig2A + lift).mean()
+                return (np.count_nonzero(dx < -lift) / n,
+                        np.count_nonzero(dsig2 < -lift) / n)
             else:
-                return ((xA > xB + lift).mean(),
-                        (sig2A > sig2B + lift).mean()), (
-                        (xB > xA + lift).mean(),
-                        (sig2B > sig2A + lift).mean())
+                return (np.count_nonzero(dx > lift) / n,
+                        np.count_nonzero(dsig2 > lift) / n), (
+                        np.count_nonzero(dx < -lift) / n,
+                        np.count_nonzero(dsig2 < -lift) / n)
 
     def expected_loss(self, method="exact", variant="A", lift=0):
         r"""
@@ -785,6 +862,10 @@ class NormalInverseGammaABTest(BayesABTest):
         t-distribution for the expected loss of the mean when the number
         of degrees of freedom is large. For small values, numerical
         intergration is used.
+
+        Method "MC" samples are cached and reused until ``simulations``,
+        ``random_state`` or the posterior parameters change. Hence, repeated
+        calls return identical estimates, even if ``random_state=None``.
         """
         check_ab_method(method=method, method_options=("exact", "MC"),
                         variant=variant, lift=lift)
@@ -803,14 +884,31 @@ class NormalInverseGammaABTest(BayesABTest):
             sigA = self.modelA.std()[0]
             sigB = self.modelB.std()[0]
 
-            if min(aA, aB) > 50 or max(aA, aB) <= 1:
+            normal_approx = min(aA, aB) > 50 or max(aA, aB) <= 1
+
+            if normal_approx:
                 u = muB - muA
                 s = np.hypot(sigA, sigB)
 
                 t0 = s * np.exp(-0.5 * (u / s) ** 2) / np.sqrt(2 * np.pi)
 
-            if variant == "A":
-                if min(aA, aB) > 50 or max(aA, aB) <= 1:
+            # E[max(B - A, 0)] - E[max(A - B, 0)] = E[B - A], so for variant
+            # "all" only the smaller loss is evaluated and the other one is
+            # recovered adding the difference of means.
+            if variant == "all":
+                mean_variant = "A" if muA >= muB else "B"
+
+                if min(aA, aB) > 1:
+                    var_diff = bB / (aB - 1) - bA / (aA - 1)
+                    var_variant = "A" if var_diff <= 0 else "B"
+                else:
+                    var_variant = "A"
+            else:
+                mean_variant = var_variant = variant
+
+            # mean
+            if mean_variant == "A":
+                if normal_approx:
                     # mean using normal approximation
                     el_mean = t0 + u * special.ndtr(u / s)
                 else:
@@ -821,19 +919,8 @@ class NormalInverseGammaABTest(BayesABTest):
                     el_mean = integrate.quad(
                         func=func_ab_el, a=-np.inf, b=np.inf, args=(
                             muB, sB, 2*aB, muA, sA, 2*aA))[0]
-
-                # variance
-                if min(aA, aB) > 1:
-                    ta = bA / (aA - 1) * special.betainc(
-                        aB, aA - 1, bB / (bA + bB))
-                    tb = bB / (aB - 1) * special.betainc(
-                        aB - 1, aA, bB / (bA + bB))
-                    el_var = tb - ta
-                else:
-                    el_var = np.nan
-                return el_mean, el_var
-            elif variant == "B":
-                if min(aA, aB) > 50 or max(aA, aB) <= 1:
+            else:
+                if normal_approx:
                     # mean using normal approximation
                     el_mean = t0 - u * special.ndtr(-u / s)
                 else:
@@ -845,42 +932,69 @@ class NormalInverseGammaABTest(BayesABTest):
                         func=func_ab_el, a=-np.inf, b=np.inf, args=(
                             muA, sA, 2*aA, muB, sB, 2*aB))[0]
 
-                # variance
-                if min(aA, aB) > 1:
+            # variance
+            if min(aA, aB) > 1:
+                if var_variant == "A":
+                    ta = bA / (aA - 1) * special.betainc(
+                        aB, aA - 1, bB / (bA + bB))
+                    tb = bB / (aB - 1) * special.betainc(
+                        aB - 1, aA, bB / (bA + bB))
+                    el_var = tb - ta
+                else:
                     ta = bA / (aA - 1) * special.betainc(
                         aA - 1, aB, bA / (bA + bB))
                     tb = bB / (aB - 1) * special.betainc(
                         aA, aB - 1, bA / (bA + bB))
                     el_var = ta - tb
-                else:
-                    el_var = np.nan
+            else:
+                el_var = np.nan
+
+            if variant != "all":
                 return el_mean, el_var
+
+            if mean_variant == "A":
+                el_mean_A, el_mean_B = el_mean, el_mean + muA - muB
             else:
-                el_mean_A, el_var_A = self.expected_loss(
-                    method=method, variant="A", lift=lift)
+                el_mean_A, el_mean_B = el_mean + muB - muA, el_mean
 
-                el_mean_B, el_var_B = self.expected_loss(
-                    method=method, variant="B", lift=lift)
+            if min(aA, aB) <= 1:
+                el_var_A = el_var_B = np.nan
+            elif var_variant == "A":
+                el_var_A, el_var_B = el_var, el_var - var_diff
+            else:
+                el_var_A, el_var_B = el_var + var_diff, el_var
 
-                return (el_mean_A, el_var_A), (el_mean_B, el_var_B)
+            return (el_mean_A, el_var_A), (el_mean_B, el_var_B)
         else:
-            data_A = self.modelA.rvs(self.simulations, self.random_state)
-            data_B = self.modelB.rvs(self.simulations, self.random_state)
+            data_A, data_B = self._rvs()
 
             xA, sig2A = data_A[:, 0], data_A[:, 1]
             xB, sig2B = data_B[:, 0], data_B[:, 1]
 
+            # differences are shared by both variants. The losses are
+            # computed in place in a single scratch buffer.
+            dx = xB - xA
+            dsig2 = sig2B - sig2A
+            buf = np.empty_like(dx)
+
+            if variant in ("A", "all"):
+                np.subtract(dx, lift, out=buf)
+                el_mean_A = np.maximum(buf, 0, out=buf).mean()
+                np.subtract(dsig2, lift, out=buf)
+                el_var_A = np.maximum(buf, 0, out=buf).mean()
+
+            if variant in ("B", "all"):
+                np.subtract(-lift, dx, out=buf)
+                el_mean_B = np.maximum(buf, 0, out=buf).mean()
+                np.subtract(-lift, dsig2, out=buf)
+                el_var_B = np.maximum(buf, 0, out=buf).mean()
+
             if variant == "A":
-                return (np.maximum(xB - xA - lift, 0).mean(),
-                        np.maximum(sig2B - sig2A - lift, 0).mean())
+                return el_mean_A, el_var_A
             elif variant == "B":
-                return (np.maximum(xA - xB - lift, 0).mean(),
-                        np.maximum(sig2A - sig2B - lift, 0).mean())
+                return el_mean_B, el_var_B
             else:
-                return (np.maximum(xB - xA - lift, 0).mean(),
-                        np.maximum(sig2B - sig2A - lift, 0).mean()), (
-                        np.maximum(xA - xB - lift, 0).mean(),
-                        np.maximum(sig2A - sig2B - lift, 0).mean())
+                return (el_mean_A, el_var_A), (el_mean_B, el_var_B)
 
     def expected_loss_relative(self, method="exact", variant="A"):
         r"""
@@ -947,8 +1061,7 @@ class NormalInverseGammaABTest(BayesABTest):
 
                 return (elr_mean_ba, elr_var_ba), (elr_mean_ab, elr_var_ab)
         else:
-            data_A = self.modelA.rvs(self.simulations, self.random_state)
-            data_B = self.modelB.rvs(self.simulations, self.random_state)
+            data_A, data_B = self._rvs()
 
             xA, sig2A = data_A[:, 0], data_A[:, 1]
             xB, sig2B = data_B[:, 0], data_B[:, 1]
@@ -1001,8 +1114,7 @@ class NormalInverseGammaABTest(BayesABTest):
                         variant=variant, interval_length=interval_length)
 
         if method == "MC":
-            data_A = self.modelA.rvs(self.simulations, self.random_state)
-            data_B = self.modelB.rvs(self.simulations, self.random_state)
+            data_A, data_B = self._rvs()
 
             xA, sig2A = data_A[:, 0], data_A[:, 1]
             xB, sig2B = data_B[:, 0], data_B[:, 1]
@@ -1098,8 +1210,7 @@ class NormalInverseGammaABTest(BayesABTest):
                         variant=variant, interval_length=interval_length)
 
         if method == "MC":
-            data_A = self.modelA.rvs(self.simulations, self.random_state)
-            data_B = self.modelB.rvs(self.simulations, self.random_state)
+            data_A, data_B = self._rvs()
 
             xA, sig2A = data_A[:, 0], data_A[:, 1]
             xB, sig2B = data_B[:, 0], data_B[:, 1]
@@ -1204,6 +1315,25 @@ class NormalInverseGammaABTest(BayesABTest):
                         method=method,
                         variant="B", interval_length=interval_length))
 
+    def _rvs(self):
+        # samples are reused until the simulation settings or any posterior
+        # parameter change, e.g., after update_A or update_B
+        key = (self.simulations, self.random_state) + tuple(
+            (model.loc_posterior, model.variance_scale_posterior,
+             model.shape_posterior, model.scale_posterior)
+            for model in (self.modelA, self.modelB))
+
+        if self._mc_cache is None or self._mc_cache[0] != key:
+            # a single generator gives independent streams for A and B
+            rng = np.random.default_rng(self.random_state)
+
+            data_A = self.modelA.rvs(self.simulations, rng, antithetic=True)
+            data_B = self.modelB.rvs(self.simulations, rng, antithetic=True)
+
+            self._mc_cache = (key, (data_A, data_B))
+
+        return self._mc_cache[1]
+
 
 class NormalInverseGammaMVTest(BayesMVTest):
     """
@@ -1294,13 +1424,15 @@ class NormalInverseGammaMVTest(BayesMVTest):
             prob_var = special.betainc(a1, a0, p)
             return prob_mean, prob_var
         else:
-            data_0 = model_control.rvs(self.simulations, self.random_state)
-            data_1 = model_variant.rvs(self.simulations, self.random_state)
+            data_0, data_1 = self._rvs_pair(control, variant)
 
             x0, sig20 = data_0[:, 0], data_0[:, 1]
             x1, sig21 = data_1[:, 0], data_1[:, 1]
 
-            return (x1 > x0 + lift).mean(), (sig21 > sig20 + lift).mean()
+            n = x0.size
+
+            return (np.count_nonzero(x1 > x0 + lift) / n,
+                    np.count_nonzero(sig21 > sig20 + lift) / n)
 
     def probability_vs_all(self, method="quad", variant="B", lift=0,
                            mlhs_samples=1000):
@@ -1341,25 +1473,13 @@ class NormalInverseGammaMVTest(BayesMVTest):
         variants.remove(variant)
 
         if method == "MC":
-            # generate samples from all models in parallel
-            xvariant = self.models[variant].rvs(self.simulations,
-                                                self.random_state)
-
-            pool = Pool(processes=self.n_jobs)
-            processes = [pool.apply_async(self._rvs, args=(v, ))
-                         for v in variants]
-
-            xall = [p.get() for p in processes]
+            xvariant, xall = self._rvs_vs_all(variant, variants)
             maxall = np.maximum.reduce(xall)
 
             return (xvariant > maxall + lift).mean(axis=0)
         else:
             # prepare parameters
-            variant_params = [(self.models[v].loc_posterior,
-                              self.models[v].variance_scale_posterior,
-                              self.models[v].shape_posterior,
-                              self.models[v].scale_posterior)
-                              for v in variants]
+            variant_params = self._posterior_params(variants)
 
             mu = self.models[variant].loc_posterior
             la = self.models[variant].variance_scale_posterior
@@ -1393,15 +1513,16 @@ class NormalInverseGammaMVTest(BayesMVTest):
                 # mean
                 x = stats.t(df=2 * a, loc=mu, scale=np.sqrt(b / a / la)).ppf(r)
 
-                prob_mean = np.nanmean(
-                    np.prod([special.stdtr(2*a, (x - mu) / np.sqrt(b / a / la))
-                            for mu, la, a, b in variant_params], axis=0))
+                uu, ll, aa, bb = variant_params
+                x = x[..., np.newaxis]
+
+                prob_mean = np.nanmean(np.prod(special.stdtr(
+                    2 * aa, (x - uu) / np.sqrt(bb / aa / ll)), axis=1))
 
                 # variance
-                x = stats.invgamma(a=a, scale=b).ppf(r)
-                prob_var = np.nanmean(np.prod([special.gammaincc(a, b / x)
-                                      for _, _, a, b in variant_params],
-                                      axis=0))
+                x = stats.invgamma(a=a, scale=b).ppf(r)[..., np.newaxis]
+                prob_var = np.nanmean(np.prod(special.gammaincc(aa, bb / x),
+                                              axis=1))
 
                 return prob_mean, prob_var
 
@@ -1486,8 +1607,7 @@ class NormalInverseGammaMVTest(BayesMVTest):
                 el_var = np.nan
             return el_mean, el_var
         else:
-            data_0 = model_control.rvs(self.simulations, self.random_state)
-            data_1 = model_variant.rvs(self.simulations, self.random_state)
+            data_0, data_1 = self._rvs_pair(control, variant)
 
             x0, sig20 = data_0[:, 0], data_0[:, 1]
             x1, sig21 = data_1[:, 0], data_1[:, 1]
@@ -1535,8 +1655,7 @@ class NormalInverseGammaMVTest(BayesMVTest):
         model_variant = self.models[variant]
 
         if method == "MC":
-            data_0 = model_control.rvs(self.simulations, self.random_state)
-            data_1 = model_variant.rvs(self.simulations, self.random_state)
+            data_0, data_1 = self._rvs_pair(control, variant)
 
             x0, sig20 = data_0[:, 0], data_0[:, 1]
             x1, sig21 = data_1[:, 0], data_1[:, 1]
@@ -1619,8 +1738,7 @@ class NormalInverseGammaMVTest(BayesMVTest):
 
             return elr_mean, elr_var
         else:
-            data_0 = model_control.rvs(self.simulations, self.random_state)
-            data_1 = model_variant.rvs(self.simulations, self.random_state)
+            data_0, data_1 = self._rvs_pair(control, variant)
 
             x0, sig20 = data_0[:, 0], data_0[:, 1]
             x1, sig21 = data_1[:, 0], data_1[:, 1]
@@ -1660,51 +1778,25 @@ class NormalInverseGammaMVTest(BayesMVTest):
         variants.remove(variant)
 
         if method == "MC":
-            # generate samples from all models in parallel
-            xvariant = self.models[variant].rvs(self.simulations,
-                                                self.random_state)
-
-            pool = Pool(processes=self.n_jobs)
-            processes = [pool.apply_async(self._rvs, args=(v, ))
-                         for v in variants]
-            xall = [p.get() for p in processes]
+            xvariant, xall = self._rvs_vs_all(variant, variants)
             maxall = np.maximum.reduce(xall)
 
             return (maxall / xvariant).mean(axis=0) - 1
         else:
             # prepare parameters
-            variant_params = [(self.models[v].loc_posterior,
-                              self.models[v].variance_scale_posterior,
-                              self.models[v].shape_posterior,
-                              self.models[v].scale_posterior)
-                              for v in variants]
+            variant_params = self._posterior_params(variants)
 
             mu = self.models[variant].loc_posterior
-            la = self.models[variant].variance_scale_posterior
             a = self.models[variant].shape_posterior
             b = self.models[variant].scale_posterior
 
             if method == "quad":
-                max_ig = np.max([stats.invgamma(
-                    a=self.models[v].shape_posterior,
-                    scale=self.models[v].scale_posterior).ppf(0.99999999)
-                    for v in variants])
-
-                t_ppfs = [stats.t(
-                    df=2*self.models[v].shape_posterior,
-                    loc=self.models[v].loc_posterior,
-                    scale=np.sqrt(
-                        self.models[v].scale_posterior /
-                        self.models[v].shape_posterior /
-                        self.models[v].variance_scale_posterior)).ppf(
-                    [0.00000001, 0.99999999]) for v in variants]
-
-                min_t = np.min([q[0] for q in t_ppfs])
-                max_t = np.max([q[1] for q in t_ppfs])
+                min_t, max_t, max_ig = self._integration_bounds(
+                    variant_params)
 
                 # mean
                 e_max = integrate.quad(func=func_mv_elr_mean, a=min_t,
-                                       b=max_t, args=(variant_params))[0]
+                                       b=max_t, args=(variant_params,))[0]
 
                 e_inv_x = (1 + self.models[variant].var()[0] / mu ** 2) / mu
 
@@ -1712,7 +1804,7 @@ class NormalInverseGammaMVTest(BayesMVTest):
 
                 # variance
                 e_max = integrate.quad(func=func_mv_elr_var, a=0, b=max_ig,
-                                       args=(variant_params))[0]
+                                       args=(variant_params,))[0]
                 e_inv_x = a / b
 
                 elr_variance = e_max * e_inv_x - 1
@@ -1724,9 +1816,8 @@ class NormalInverseGammaMVTest(BayesMVTest):
                 r = (r - 0.5) / mlhs_samples
                 r = r[..., np.newaxis]
 
-                n = len(variant_params)
-                variant_params.append((mu, la, a, b))
-                uu, ll, aa, bb = map(np.array, zip(*variant_params))
+                n = len(variants)
+                uu, ll, aa, bb = self._posterior_params(variants + [variant])
                 vv = 2 * aa
                 ss = np.sqrt(bb / aa / ll)
 
@@ -1794,8 +1885,7 @@ class NormalInverseGammaMVTest(BayesMVTest):
         model_variant = self.models[variant]
 
         if method == "MC":
-            data_0 = model_control.rvs(self.simulations, self.random_state)
-            data_1 = model_variant.rvs(self.simulations, self.random_state)
+            data_0, data_1 = self._rvs_pair(control, variant)
 
             x0, sig20 = data_0[:, 0], data_0[:, 1]
             x1, sig21 = data_1[:, 0], data_1[:, 1]
@@ -1884,44 +1974,19 @@ class NormalInverseGammaMVTest(BayesMVTest):
             # exclude variant
             variants.remove(variant)
 
-            # generate samples from all models in parallel
-            xvariant = self.models[variant].rvs(self.simulations,
-                                                self.random_state)
-
-            pool = Pool(processes=self.n_jobs)
-            processes = [pool.apply_async(self._rvs, args=(v, ))
-                         for v in variants]
-            xall = [p.get() for p in processes]
+            xvariant, xall = self._rvs_vs_all(variant, variants)
             maxall = np.maximum.reduce(xall)
 
             return np.maximum(maxall - xvariant - lift, 0).mean(axis=0)
         else:
-            max_ig = np.max([stats.invgamma(
-                a=self.models[v].shape_posterior,
-                scale=self.models[v].scale_posterior).ppf(0.99999999)
-                for v in variants])
-
-            t_ppfs = [stats.t(
-                df=2*self.models[v].shape_posterior,
-                loc=self.models[v].loc_posterior,
-                scale=np.sqrt(
-                    self.models[v].scale_posterior /
-                    self.models[v].shape_posterior /
-                    self.models[v].variance_scale_posterior)).ppf(
-                [0.00000001, 0.99999999]) for v in variants]
-
-            min_t = np.min([q[0] for q in t_ppfs])
-            max_t = np.max([q[1] for q in t_ppfs])
+            min_t, max_t, max_ig = self._integration_bounds(
+                self._posterior_params(variants))
 
             # exclude variant
             variants.remove(variant)
 
             # prepare parameters
-            variant_params = [(self.models[v].loc_posterior,
-                              self.models[v].variance_scale_posterior,
-                              self.models[v].shape_posterior,
-                              self.models[v].scale_posterior)
-                              for v in variants]
+            variant_params = self._posterior_params(variants)
 
             mu = self.models[variant].loc_posterior
             la = self.models[variant].variance_scale_posterior
@@ -1971,3 +2036,53 @@ class NormalInverseGammaMVTest(BayesMVTest):
                 el_var = np.nanmean(p - q)
 
                 return el_mean, el_var
+
+    def _rvs_pair(self, control, variant):
+        # a single generator gives independent streams for both variants
+        rng = np.random.default_rng(self.random_state)
+
+        data_0 = self.models[control].rvs(self.simulations, rng,
+                                          antithetic=True)
+        data_1 = self.models[variant].rvs(self.simulations, rng,
+                                          antithetic=True)
+
+        return data_0, data_1
+
+    def _rvs_variant(self, variant, seed):
+        return self.models[variant].rvs(self.simulations, seed,
+                                        antithetic=True)
+
+    def _rvs_vs_all(self, variant, variants):
+        # independent seeds for each variant, picklable for the pool
+        seeds = np.random.SeedSequence(self.random_state).spawn(
+            len(variants) + 1)
+
+        # generate samples from all models in parallel
+        xvariant = self._rvs_variant(variant, seeds[0])
+
+        pool = Pool(processes=self.n_jobs)
+        processes = [pool.apply_async(self._rvs_variant, args=(v, seed))
+                     for v, seed in zip(variants, seeds[1:])]
+        xall = [p.get() for p in processes]
+
+        return xvariant, xall
+
+    def _posterior_params(self, variants):
+        models = [self.models[v] for v in variants]
+
+        uu = np.fromiter((m.loc_posterior for m in models), np.float64)
+        ll = np.fromiter((m.variance_scale_posterior for m in models),
+                         np.float64)
+        aa = np.fromiter((m.shape_posterior for m in models), np.float64)
+        bb = np.fromiter((m.scale_posterior for m in models), np.float64)
+
+        return uu, ll, aa, bb
+
+    def _integration_bounds(self, params):
+        uu, ll, aa, bb = params
+
+        t_ppfs = stats.t(df=2 * aa, loc=uu, scale=np.sqrt(bb / aa / ll)).ppf(
+            [[0.00000001], [0.99999999]])
+        max_ig = stats.invgamma(a=aa, scale=bb).ppf(0.99999999).max()
+
+        return t_ppfs[0].min(), t_ppfs[1].max(), max_ig
@@ -5,6 +5,9 @@ Bayesian model with binomial likelihood.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
+import math
+import numbers
+
 import numpy as np
 
 from scipy import special
@@ -16,6 +19,10 @@ from ..cdist.utils import check_models
 from ..cdist.utils import check_mv_models
 
 
+# largest number of trials with precomputed log binomial coefficients
+_MAX_LOGCOMB_M = 4096
+
+
 class BinomialModel(BetaModel):
     r"""
     Bayesian model with a binomial likelihood and a beta prior distribution.
@@ -56,9 +63,16 @@ class BinomialModel(BetaModel):
         self.m = m
         self.n_samples_ = 0
 
-        if not isinstance(m, np.int) or m < 0:
+        if not isinstance(m, numbers.Integral) or m < 0:
             raise ValueError("m must an integer >= 0.")
 
+        if m <= _MAX_LOGCOMB_M:
+            k = np.arange(m + 1)
+            self._logcomb = (special.gammaln(m + 1) - special.gammaln(k + 1)
+                             - special.gammaln(m - k + 1))
+        else:
+            self._logcomb = None
+
     def update(self, data):
         """
         Update posterior parameters with new data samples.
@@ -70,7 +84,13 @@ class BinomialModel(BetaModel):
         """
         x = np.asarray(data)
         n = x.size
-        n_success = np.sum(x)
+
+        # int64 accumulator avoids overflow of narrow integer dtypes
+        if np.issubdtype(x.dtype, np.integer):
+            n_success = int(x.sum(dtype=np.int64))
+        else:
+            n_success = x.sum()
+
         self._alpha_posterior += n_success
         self._beta_posterior += self.m * n - n_success
         self.n_samples_ += n
@@ -104,20 +124,26 @@ class BinomialModel(BetaModel):
         a = self._alpha_posterior
         b = self._beta_posterior
 
-        k = np.floor(x)
+        if np.ndim(x) == 0:
+            return self._pppdf_scalar(x, a, b)
+
+        k = np.floor(np.asarray(x, dtype=np.float64))
         pdf = np.zeros(k.shape)
         idx = (k >= 0) & (k <= self.m)
         k = k[idx]
 
-        loggm = special.gammaln(self.m + 1)
-        loggx = special.gammaln(k + 1)
-        loggmx = special.gammaln(self.m - k + 1)
+        logpdf = special.betaln(a + k, b + self.m - k)
+        logpdf -= special.betaln(a, b)
 
-        logcomb = loggm - loggx - loggmx
-        logbeta = special.betaln(a + k, b + self.m - k) - special.betaln(a, b)
-        logpdf = logcomb + logbeta
+        # log binomial coefficients from the table when available
+        if self._logcomb is not None:
+            logpdf += self._logcomb[k.astype(np.int64)]
+        else:
+            logpdf += special.gammaln(self.m + 1)
+            logpdf -= special.gammaln(k + 1)
+            logpdf -= special.gammaln(self.m - k + 1)
 
-        pdf[idx] = np.exp(logpdf)
+        pdf[idx] = np.exp(logpdf, out=logpdf)
 
         return pdf
 
@@ -168,6 +194,23 @@ class BinomialModel(BetaModel):
 
         return self.m * (self.m + a + b) * a * b / (a + b) ** 2 / (a + b + 1)
 
+    def _pppdf_scalar(self, x, a, b):
+        # scalar quantiles skip the masking and array allocations; betaln
+        # avoids the cancellation of separate lgamma terms for large a, b
+        k = float(np.floor(x))
+        if not 0 <= k <= self.m:
+            return 0.0
+
+        m = self.m
+        if self._logcomb is not None:
+            logcomb = self._logcomb[int(k)]
+        else:
+            logcomb = (special.gammaln(m + 1) - special.gammaln(k + 1)
+                       - special.gammaln(m - k + 1))
+        logbeta = special.betaln(a + k, b + m - k) - special.betaln(a, b)
+
+        return math.exp(logcomb + logbeta)
+
 
 class BinomialABTest(BetaABTest):
     """
@@ -5,6 +5,8 @@ Bayesian model with negative binomial likelihood.
 # Guillermo Navas-Palencia <g.navas.palencia@gmail.com>
 # Copyright (C) 2019
 
+import numbers
+
 import numpy as np
 
 from scipy import special
@@ -57,7 +59,7 @@ class NegativeBinomialModel(BetaModel):
         self.r = r
         self.n_samples_ = 0
 
-        if not isinstance(r, np.int) or r <= 0:
+        if not isinstance(r, numbers.Integral) or r <= 0:
             raise ValueError("r must be a positive integer > 0.")
 
     def update(self, data):
@@ -61,7 +61,7 @@ else:
 install_requires = [
     'matplotlib>=3.0.3',
     'mpmath>=1.0.0',
-    'numpy>=1.15.0',
+    'numpy>=1.17.0',
     'pandas>=0.24.2',
     'scipy>=1.0.0',
     'jinja2>=2.10',
@@ -8,6 +8,7 @@ Binomial distribution testing.
 import numpy as np
 
 from pytest import approx, raises
+from scipy import stats
 
 from cprior.models import BinomialABTest
 from cprior.models import BinomialModel
@@ -46,6 +47,25 @@ def test_binomial_model_stats():
     assert model.ppvar() == approx(4.36363636364)
 
 
+def test_binomial_model_pppdf_scalar_large_posterior():
+    for alpha, beta in [(1e6, 2e6), (1e9, 3e9), (1e12, 3e12)]:
+        model = BinomialModel(m=10, alpha=alpha, beta=beta)
+
+        for x in [0, 3, 10]:
+            assert model.pppdf(x) == approx(model.pppdf([x])[0], rel=1e-12)
+
+
+def test_binomial_model_pppdf_large_m():
+    model = BinomialModel(m=5000, alpha=4, beta=6)
+    x = [0, 1, 1000, 2500, 5000]
+
+    expected = stats.betabinom(5000, 4, 6).pmf(x)
+
+    assert model._logcomb is None
+    assert model.pppdf(x) == approx(expected, rel=1e-8)
+    assert [model.pppdf(xi) for xi in x] == approx(expected, rel=1e-8)
+
+
 def test_binomial_ab_check_models():
     modelA = BinomialModel(m=10, alpha=1, beta=1)
     modelB = GeometricModel(alpha=1, beta=1)
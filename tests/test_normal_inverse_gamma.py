@@ -13,6 +13,7 @@ from cprior.cdist import NormalInverseGammaABTest
 from cprior.cdist import NormalInverseGammaModel
 from cprior.cdist import NormalInverseGammaMVTest
 from cprior.cdist.normal_inverse_gamma import NormalInverseGamma
+from cprior.cdist.normal_inverse_gamma import probability_batch
 
 
 def test_normal_inverse_gamma_variance_scale_positive():
@@ -56,6 +57,18 @@ def test_normal_inverse_gamma_check_input():
         NormalInverseGamma().pdf(x, sig2)
 
 
+def test_normal_inverse_gamma_rvs_antithetic():
+    nig = NormalInverseGamma(loc=1, variance_scale=2, shape=3, scale=4)
+
+    rvs = nig.rvs(size=6, random_state=42, antithetic=True)
+    z = (rvs[:, 0] - 1) / np.sqrt(rvs[:, 1] / 2)
+    assert z[:3] == approx(-z[3:], rel=1e-12)
+
+    rvs = nig.rvs(size=6, random_state=42)
+    z = (rvs[:, 0] - 1) / np.sqrt(rvs[:, 1] / 2)
+    assert z[:3] != approx(-z[3:])
+
+
 def test_normal_inverse_gamma_model_variance_scale_positive():
     with raises(ValueError):
         NormalInverseGammaModel(variance_scale=-0.1)
@@ -135,6 +148,58 @@ def test_normal_inverse_gamma_ab_probability_large_df():
     assert test[1] == approx((0.1743898586, 0.5995924969), rel=1e-8)
 
 
+def test_normal_inverse_gamma_ab_probability_batch():
+    modelA = NormalInverseGammaModel(loc=8.5, variance_scale=13, shape=51,
+                                     scale=15)
+    modelB = NormalInverseGammaModel(loc=8.3, variance_scale=14, shape=55,
+                                     scale=17)
+    abtest = NormalInverseGammaABTest(modelA, modelB, 1000000)
+
+    prob_mean, prob_var = probability_batch(
+        [8.5, 8.3], [13, 14], [51, 55], [15, 17],
+        [8.3, 8.5], [14, 13], [55, 51], [17, 15])
+
+    test = abtest.probability(method="exact", variant="all")
+    assert prob_mean == approx([test[0][0], test[1][0]], rel=1e-8)
+    assert prob_var == approx([test[0][1], test[1][1]], rel=1e-8)
+
+
+def test_normal_inverse_gamma_ab_probability_mc_random_state():
+    modelA = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5)
+    modelB = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5)
+    abtest = NormalInverseGammaABTest(modelA, modelB, 100000, random_state=42)
+
+    assert abtest.probability(method="MC", variant="A") == approx(
+        (0.5, 0.5), rel=1e-1)
+
+
+def test_normal_inverse_gamma_ab_mc_cache():
+    modelA = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5)
+    modelB = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5)
+    abtest = NormalInverseGammaABTest(modelA, modelB, 1000)
+
+    data_A, data_B = abtest._rvs()
+    cached_A, cached_B = abtest._rvs()
+    assert cached_A is data_A
+    assert cached_B is data_B
+
+    modelB._loc_posterior = 6.0
+    cached_A, cached_B = abtest._rvs()
+    assert cached_A is not data_A
+    assert cached_B is not data_B
+
+    data_A, data_B = cached_A, cached_B
+    abtest.simulations = 2000
+    cached_A, cached_B = abtest._rvs()
+    assert cached_A is not data_A
+    assert cached_B is not data_B
+    assert cached_B.shape[0] == 2000
+
+
 def test_normal_inverse_gamma_ab_expected_loss():
     modelA = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
                                      scale=5)
@@ -163,6 +228,20 @@ def test_normal_inverse_gamma_ab_expected_loss():
     assert test[1] == approx((0.0612998985, 0.0028602780), rel=1e-1)
 
 
+def test_normal_inverse_gamma_ab_expected_loss_mc_lift():
+    modelA = NormalInverseGammaModel(loc=50, variance_scale=3, shape=14,
+                                     scale=5)
+    modelB = NormalInverseGammaModel(loc=5, variance_scale=3, shape=14,
+                                     scale=5)
+    abtest = NormalInverseGammaABTest(modelA, modelB, 1000000, random_state=1)
+
+    for lift in (0.3, 0.7):
+        el_A, el_B = abtest.expected_loss(method="MC", variant="all",
+                                          lift=lift)
+        assert el_A[0] == 0
+        assert el_B[0] == approx(45 - lift, rel=1e-3)
+
+
 def test_normal_inverse_gamma_ab_expected_loss_large_df():
     modelA = NormalInverseGammaModel(loc=8.5, variance_scale=13, shape=51,
                                      scale=15)
@@ -391,6 +470,20 @@ def test_normal_inverse_gamma_mv_probability_vs_all():
         (0.1703097379, 0.9576994541), rel=1e-1)
 
 
+def test_normal_inverse_gamma_mv_probability_vs_all_mc_random_state():
+    models = {
+        "A": NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5),
+        "B": NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
+                                     scale=5)
+    }
+
+    mvtest = NormalInverseGammaMVTest(models, 100000, random_state=3)
+
+    assert mvtest.probability_vs_all(method="MC", variant="B") == approx(
+        (0.5, 0.5), rel=1e-1)
+
+
 def test_normal_inverse_gamma_mv_expected_loss():
     modelA = NormalInverseGammaModel(loc=5.5, variance_scale=3, shape=14,
                                      scale=5)